@@ -0,0 +1,256 @@
+"""JSON scoring API for Kiro Fitfin AI.
+
+A dependency-free ASGI app exposing the dashboard scoring and badge logic to
+mobile clients. Run it with any ASGI server, e.g.::
+
+    uvicorn api:app --port 8000
+
+Endpoints:
+
+- ``GET /health`` returns ``{"status": "ok"}``
+- ``POST /score`` scores one metrics object
+- ``POST /score/batch`` scores ``{"items": [...]}`` in one call
+
+Concurrent ``/score`` requests are coalesced for up to a few milliseconds
+and scored together with ``score_batch``.
+"""
+
+import asyncio
+import logging
+import math
+import os
+from contextlib import contextmanager
+
+from scoring import DEFAULT_METRICS, METRIC_LIMITS, score_batch
+
+try:
+    import orjson
+
+    def dumps(payload):
+        return orjson.dumps(payload)
+
+    loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    import json
+
+    def dumps(payload):
+        return json.dumps(payload, separators=(",", ":"), allow_nan=False).encode()
+
+    def _reject_constant(name):
+        raise ValueError(f"{name} is not valid JSON")
+
+    def loads(body):
+        return json.loads(body, parse_constant=_reject_constant)
+
+COALESCE_WINDOW_MS = float(os.environ.get("KIRO_COALESCE_WINDOW_MS", "2"))
+COALESCE_MAX_BATCH = int(os.environ.get("KIRO_COALESCE_MAX_BATCH", "512"))
+MAX_BATCH_ITEMS = 10000
+
+logger = logging.getLogger(__name__)
+
+
+class RequestError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def validate_metrics(record):
+    if not isinstance(record, dict):
+        raise RequestError("metrics must be a JSON object")
+    unknown = set(record) - set(DEFAULT_METRICS)
+    if unknown:
+        raise RequestError(f"unknown fields: {', '.join(sorted(unknown))}")
+    metrics = {}
+    for name, value in record.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise RequestError(f"{name} must be a number")
+        try:
+            value = float(value)
+        except OverflowError:
+            value = math.inf
+        if not math.isfinite(value):
+            raise RequestError(f"{name} must be a finite number")
+        if value < 0:
+            raise RequestError(f"{name} must not be negative")
+        if value > METRIC_LIMITS[name]:
+            raise RequestError(f"{name} must be at most {METRIC_LIMITS[name]}")
+        metrics[name] = value
+    return metrics
+
+
+class ScoreCoalescer:
+    """Collects single-score requests and scores them as one batch.
+
+    Handlers wrap their work in ``request()`` so the coalescer knows how many
+    requests are in flight. Once every in-flight request is queued nobody
+    else can join, so the batch is scored on the next loop iteration.
+    Otherwise a timer of ``window_ms`` gives the rest a chance to catch up. A
+    full queue of ``max_batch`` records is flushed straight away.
+    """
+
+    def __init__(self, window_ms=COALESCE_WINDOW_MS, max_batch=COALESCE_MAX_BATCH):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._pending = []
+        self._timer = None
+        self._flush_soon = False
+        self._active = 0
+
+    @contextmanager
+    def request(self):
+        self._active += 1
+        try:
+            yield
+        finally:
+            self._active -= 1
+            self._schedule()
+
+    async def score(self, record):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((record, future))
+        self._schedule()
+        return await future
+
+    def _schedule(self):
+        waiting = len(self._pending)
+        if not waiting or self._flush_soon:
+            return
+        if waiting >= self.max_batch:
+            self.flush()
+            return
+        loop = asyncio.get_running_loop()
+        if waiting >= self._active:
+            # Everyone in flight is queued, so waiting out the window gains nothing
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = loop.call_soon(self.flush)
+            self._flush_soon = True
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+
+    def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._flush_soon = False
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            results = score_batch([record for record, _ in pending])
+        except Exception:
+            # Score one at a time so a bad record only fails its own request
+            for record, future in pending:
+                try:
+                    result = score_batch([record])[0]
+                except Exception as exc:
+                    if not future.done():
+                        future.set_exception(exc)
+                    continue
+                if not future.done():
+                    future.set_result(result)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+
+coalescer = ScoreCoalescer()
+
+
+async def read_json(receive):
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise RequestError("client disconnected")
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    try:
+        return loads(b"".join(chunks))
+    except ValueError:
+        raise RequestError("request body must be valid JSON")
+
+
+async def send_json(send, status, payload):
+    body = dumps(payload)
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def handle_score(receive):
+    with coalescer.request():
+        record = validate_metrics(await read_json(receive))
+        return await coalescer.score(record)
+
+
+async def handle_batch(receive):
+    payload = await read_json(receive)
+    items = payload.get("items") if isinstance(payload, dict) else None
+    if not isinstance(items, list):
+        raise RequestError('batch body must be {"items": [...]}')
+    if len(items) > MAX_BATCH_ITEMS:
+        raise RequestError(f"batch is limited to {MAX_BATCH_ITEMS} items", status=413)
+    # Already a batch, so there is nothing to gain from coalescing it
+    return {"results": score_batch([validate_metrics(item) for item in items])}
+
+
+ROUTES = {
+    ("POST", "/score"): handle_score,
+    ("POST", "/score/batch"): handle_batch,
+}
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            coalescer.flush()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    method, path = scope["method"], scope["path"].rstrip("/") or "/"
+    if path == "/health":
+        await send_json(send, 200, {"status": "ok"})
+        return
+    handler = ROUTES.get((method, path))
+    if handler is None:
+        if any(route_path == path for _, route_path in ROUTES):
+            await send_json(send, 405, {"error": "method not allowed"})
+        else:
+            await send_json(send, 404, {"error": "not found"})
+        return
+
+    try:
+        result = await handler(receive)
+        status = 200
+    except RequestError as exc:
+        result, status = {"error": str(exc)}, exc.status
+    except Exception:
+        logger.exception("scoring request failed")
+        result, status = {"error": "internal server error"}, 500
+    try:
+        await send_json(send, status, result)
+    except ValueError:
+        # The encoder refused the result (e.g. a non-finite score)
+        logger.exception("could not encode response")
+        await send_json(send, 500, {"error": "internal server error"})
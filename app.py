@@ -3,6 +3,15 @@ import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 
+from scheduler import DAYS, DAY_MINUTES, parse_work_hours, schedule_week, split_at_midnight
+from scoring import (
+    calculate_finance_score,
+    calculate_fitness_score,
+    calculate_growth_score,
+    calculate_health_score,
+    get_score_badge,
+)
+
 # Page configuration
 st.set_page_config(
     page_title="Kiro Fitfin AI",
@@ -211,17 +220,6 @@ st.markdown("""
 if 'dark_mode' not in st.session_state:
     st.session_state.dark_mode = True
 
-# Helper function for score badges
-def get_score_badge(score):
-    if score >= 80:
-        return f'<span class="score-badge score-excellent">⭐ {score:.1f} - Excellent</span>'
-    elif score >= 60:
-        return f'<span class="score-badge score-good">✓ {score:.1f} - Good</span>'
-    elif score >= 40:
-        return f'<span class="score-badge score-fair">⚠ {score:.1f} - Fair</span>'
-    else:
-        return f'<span class="score-badge score-poor">⚡ {score:.1f} - Needs Attention</span>'
-
 # Header with gradient
 st.markdown("""
 <div style="text-align: center; padding: 20px 0;">
@@ -365,6 +363,39 @@ with st.sidebar:
     
     st.markdown("---")
     
+    # Job Schedule
+    st.markdown("### 🗓️ Job Schedule")
+    
+    work_hours = st.text_input(
+        "🕘 Work Hours",
+        value="09:00 - 17:00",
+        help="💡 Format: HH:MM - HH:MM (overnight shifts like 22:00 - 06:00 work too)"
+    )
+    
+    work_days = st.multiselect(
+        "📅 Work Days",
+        DAYS,
+        default=DAYS[:5],
+        help="💡 Days you work this shift"
+    )
+    
+    commute_minutes = st.number_input(
+        "🚌 Commute (minutes each way)",
+        min_value=0, max_value=180,
+        value=30,
+        step=5,
+        help="💡 Time blocked before and after each shift"
+    )
+    
+    block_minutes = st.select_slider(
+        "⏳ Study Block Length",
+        options=[30, 45, 60, 90, 120],
+        value=60,
+        help="💡 Length of each planned study block in minutes"
+    )
+    
+    st.markdown("---")
+    
     # Reset button
     if st.button("🔄 Reset to Defaults", use_container_width=True):
         st.session_state.preset = None
@@ -377,42 +408,6 @@ with st.sidebar:
     </div>
     """, unsafe_allow_html=True)
 
-# Calculate scores
-def calculate_health_score(calories, hydration, sleep, diet_quality):
-    score = 0
-    # Diet quality (40%)
-    score += (diet_quality / 100) * 40
-    # Hydration (30%)
-    hydration_score = min(hydration / 2.5, 1.0) * 30
-    score += hydration_score
-    # Sleep (30%)
-    sleep_score = min(sleep / 8.0, 1.0) * 30
-    score += sleep_score
-    return min(score, 100)
-
-def calculate_fitness_score(steps, minutes):
-    score = 0
-    # Steps (50%)
-    steps_score = min(steps / 10000, 1.0) * 50
-    score += steps_score
-    # Exercise minutes (50%)
-    exercise_score = min(minutes / 60, 1.0) * 50
-    score += exercise_score
-    return min(score, 100)
-
-def calculate_finance_score(home_cooked, takeout):
-    total_meals = home_cooked + takeout
-    if total_meals == 0:
-        return 0
-    home_cooked_ratio = home_cooked / total_meals
-    return home_cooked_ratio * 100
-
-def calculate_growth_score(completed, planned):
-    if planned == 0:
-        return 0
-    completion_ratio = completed / planned
-    return min(completion_ratio * 100, 100)
-
 # Calculate all scores
 health_score = calculate_health_score(calories, hydration, sleep_hours, diet_quality)
 fitness_score = calculate_fitness_score(daily_steps, exercise_minutes)
@@ -662,6 +657,77 @@ with tab4:
     )
     st.plotly_chart(fig, use_container_width=True)
     
+    # Weekly study plan packed around the job schedule
+    st.markdown("#### 🗓️ Weekly Study Plan")
+    shift = parse_work_hours(work_hours)
+    if shift is None:
+        st.warning("⚠️ Couldn't read work hours. Use the format HH:MM - HH:MM with different start and end times.")
+    shifts = [shift if day in work_days else None for day in DAYS]
+    plan = schedule_week(
+        shifts,
+        study_planned,
+        sleep_hours=sleep_hours,
+        exercise_minutes=exercise_minutes,
+        block_minutes=block_minutes,
+        commute_minutes=commute_minutes,
+    )
+    
+    fig = go.Figure()
+    activity_colors = {
+        'Sleep': '#1e293b', 'Work': '#2d2d44', 'Exercise': '#0096c7', 'Study': '#00d4ff'
+    }
+    # (day, start minute, duration) rows; overnight blocks continue on the next day's row
+    rows = [
+        (DAYS[day], start % DAY_MINUTES, end - start, block['activity'])
+        for block in plan['blocks']
+        for day, start, end in split_at_midnight(block['start_minute'], block['end_minute'])
+    ]
+    for activity, color in activity_colors.items():
+        entries = [row for row in rows if row[3] == activity]
+        if not entries:
+            continue
+        fig.add_trace(go.Bar(
+            y=[row[0] for row in entries],
+            x=[row[2] / 60 for row in entries],
+            base=[row[1] / 60 for row in entries],
+            orientation='h',
+            name=activity,
+            marker=dict(color=color),
+        ))
+    
+    fig.update_layout(
+        title="Study Blocks Around Your Shifts",
+        xaxis_title="Hour of Day",
+        barmode='overlay',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0e0'),
+        xaxis=dict(range=[0, 24], dtick=2, gridcolor='rgba(255,255,255,0.1)'),
+        yaxis=dict(categoryorder='array', categoryarray=DAYS[::-1])
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    with st.expander("📋 Plan details"):
+        st.dataframe(
+            pd.DataFrame(plan['blocks'], columns=['day', 'start', 'end', 'activity']),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    if plan['unscheduled']:
+        st.warning(
+            f"⚠️ {plan['unscheduled']} of {study_planned} study blocks don't fit this week. "
+            "Try shorter blocks or fewer planned sessions."
+        )
+    else:
+        st.success(f"✅ All {study_planned} study blocks fit around your schedule.")
+
+    if plan['unscheduled_exercise']:
+        st.warning(
+            f"⚠️ {exercise_minutes} min of exercise doesn't fit on {plan['unscheduled_exercise']} "
+            "day(s) this week. Try splitting it into shorter sessions."
+        )
+
     # Motivational message
     if completion_rate >= 80:
         st.success("🌟 Outstanding! You're crushing your study goals!")
@@ -0,0 +1,88 @@
+"""Local load benchmark for the JSON scoring API.
+
+Drives the ASGI app in-process, so the numbers cover routing, JSON and
+scoring but not the HTTP server or network. Usage::
+
+    python benchmark.py
+    python benchmark.py --requests 20000 --concurrency 1 16 128 --no-coalesce
+"""
+
+import argparse
+import asyncio
+import time
+
+import api
+from scoring import DEFAULT_METRICS
+
+
+async def call(body):
+    scope = {"type": "http", "method": "POST", "path": "/score"}
+    received = False
+    status = None
+
+    async def receive():
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await api.app(scope, receive, send)
+    return status
+
+
+async def run_level(concurrency, total, body):
+    latencies = []
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            status = await call(body)
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                raise RuntimeError(f"unexpected status {status}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return total / elapsed, p50 * 1000, p99 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000,
+                        help="requests per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 64, 256])
+    parser.add_argument("--window-ms", type=float, default=api.COALESCE_WINDOW_MS)
+    parser.add_argument("--no-coalesce", action="store_true",
+                        help="score every request on its own")
+    args = parser.parse_args()
+
+    if args.no_coalesce:
+        api.coalescer = api.ScoreCoalescer(window_ms=0, max_batch=1)
+    else:
+        api.coalescer = api.ScoreCoalescer(window_ms=args.window_ms)
+    body = api.dumps(DEFAULT_METRICS)
+
+    mode = "off" if args.no_coalesce else f"{args.window_ms:g} ms window"
+    print(f"POST /score, {args.requests} requests per level, coalescing {mode}")
+    print(f"{'concurrency':>11}  {'req/s':>10}  {'p50 ms':>8}  {'p99 ms':>8}")
+    for concurrency in args.concurrency:
+        rps, p50, p99 = asyncio.run(run_level(concurrency, args.requests, body))
+        print(f"{concurrency:>11}  {rps:>10.0f}  {p50:>8.2f}  {p99:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
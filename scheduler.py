@@ -0,0 +1,252 @@
+"""Study-block scheduler for Kiro Fitfin AI.
+
+Packs planned study blocks into the free time left over by a week of work
+shifts, sleep and exercise. Times are minutes from Monday 00:00 so overnight
+shifts and sleep that crosses midnight need no special casing.
+"""
+
+import re
+
+DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+DAY_MINUTES = 24 * 60
+WEEK_MINUTES = 7 * DAY_MINUTES
+
+# Same "Work Hours: 09:00 - 17:00" format as parseJobSchedule in dataParser.ts
+WORK_HOURS_PATTERN = re.compile(r"(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})")
+
+
+def parse_work_hours(work_hours):
+    """Turn "HH:MM - HH:MM" into (start, end) minutes, or None if unparseable."""
+    match = WORK_HOURS_PATTERN.search(work_hours or "")
+    if not match:
+        return None
+    start_h, start_m, end_h, end_m = match.groups()
+    if int(start_m) >= 60 or int(end_m) >= 60:
+        return None
+    start = int(start_h) * 60 + int(start_m)
+    end = int(end_h) * 60 + int(end_m)
+    if start >= DAY_MINUTES or end > DAY_MINUTES or start == end:
+        return None
+    return start, end
+
+
+def format_minutes(minutes):
+    minutes %= DAY_MINUTES
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def merge_intervals(intervals):
+    # Sweep line over start-sorted intervals, folding overlaps into one
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def free_intervals(busy, window_start=0, window_end=WEEK_MINUTES):
+    free = []
+    cursor = window_start
+    for start, end in merge_intervals(busy):
+        if start > cursor:
+            free.append([cursor, min(start, window_end)])
+        cursor = max(cursor, end)
+        if cursor >= window_end:
+            break
+    if cursor < window_end:
+        free.append([cursor, window_end])
+    return free
+
+
+def _clip(intervals):
+    return [
+        (max(start, 0), min(end, WEEK_MINUTES))
+        for start, end in intervals
+        if end > 0 and start < WEEK_MINUTES
+    ]
+
+
+def subtract_intervals(intervals, removed):
+    result = []
+    removed = merge_intervals(removed)
+    for start, end in merge_intervals(intervals):
+        for cut_start, cut_end in removed:
+            if cut_start >= end:
+                break
+            if cut_end <= start:
+                continue
+            if cut_start > start:
+                result.append([start, cut_start])
+            start = max(start, cut_end)
+        if start < end:
+            result.append([start, end])
+    return result
+
+
+def _is_overnight(shift):
+    return bool(shift) and shift[1] <= shift[0]
+
+
+def _work_intervals(shifts):
+    # The week repeats, so last Sunday's overnight shift spills into Monday
+    work = []
+    for day in range(-1, len(DAYS)):
+        shift = shifts[day % len(DAYS)]
+        if not shift:
+            continue
+        start, end = shift
+        if end <= start:
+            end += DAY_MINUTES
+        offset = day * DAY_MINUTES
+        work.append((offset + start, offset + end))
+    return work
+
+
+def _sleep_intervals(shifts, commuting, sleep_hours, wake_time, commute_minutes):
+    sleep_minutes = int(sleep_hours * 60)
+    sleep = []
+    # Day 7 covers the Sunday night sleep that runs into next Monday
+    for day in range(len(DAYS) + 1):
+        offset = day * DAY_MINUTES
+        shift = shifts[day % len(DAYS)]
+        previous = shifts[(day - 1) % len(DAYS)]
+        home = None
+        if previous:
+            previous_end = previous[1] + (DAY_MINUTES if _is_overnight(previous) else 0)
+            home = offset - DAY_MINUTES + previous_end + commute_minutes
+        if shift and not _is_overnight(shift):
+            # Wake in time for the pre-shift commute
+            wake = offset + min(wake_time, shift[0] - commute_minutes)
+        elif _is_overnight(previous):
+            wake = None
+        else:
+            wake = offset + wake_time
+        if wake is not None and (home is None or home <= wake - sleep_minutes):
+            sleep.append((wake - sleep_minutes, wake))
+            continue
+        # Night and late shifts: sleep once home, up to the next pre-shift commute
+        bedtime = home
+        wake = bedtime + sleep_minutes
+        if shift:
+            wake = min(wake, offset + shift[0] - commute_minutes)
+        sleep.append((bedtime, wake))
+    # Back-to-back shifts can leave less than the target; work always wins
+    return subtract_intervals(sleep, commuting)
+
+
+def split_at_midnight(start, end):
+    """Yield (day index, start, end) pieces of an interval, one per day."""
+    while start < end:
+        day = start // DAY_MINUTES
+        day_end = min(end, (day + 1) * DAY_MINUTES)
+        yield day, start, day_end
+        start = day_end
+
+
+def _day_gaps(free):
+    # Split free time at midnight so each day is packed independently
+    gaps = [[] for _ in DAYS]
+    for start, end in free:
+        for day, piece_start, piece_end in split_at_midnight(start, end):
+            gaps[day].append([piece_start, piece_end])
+    return gaps
+
+
+def _take_slot(gaps, length):
+    # Earliest gap that fits wins; the gap shrinks from the front
+    for gap in gaps:
+        if gap[1] - gap[0] >= length:
+            slot = (gap[0], gap[0] + length)
+            gap[0] += length
+            return slot
+    return None
+
+
+def schedule_week(shifts, study_blocks, sleep_hours=8.0, exercise_minutes=30,
+                  block_minutes=60, commute_minutes=0, wake_time=7 * 60):
+    """Place a week of sleep, exercise and study blocks around work.
+
+    ``shifts`` holds one (start, end) minute pair per day, or None for a day
+    off; the week is treated as repeating. Sleep follows the shifts: before
+    the pre-shift commute on day shifts, from the commute home after night
+    or late shifts, and ending at ``wake_time`` otherwise.
+    Exercise is placed once per day before study so it gets first pick of the
+    free time; study blocks are then dealt round-robin across the days to
+    spread the load. Returns the work, sleep and placed blocks, how many
+    study blocks did not fit and on how many days exercise did not fit.
+    """
+    shifts = (list(shifts) + [None] * len(DAYS))[:len(DAYS)]
+    work = _work_intervals(shifts)
+    commuting = [(start - commute_minutes, end + commute_minutes) for start, end in work]
+    sleep = _clip(_sleep_intervals(shifts, commuting, sleep_hours, wake_time, commute_minutes))
+    gaps = _day_gaps(free_intervals(_clip(commuting) + sleep))
+
+    blocks = [(start, end, "Work") for start, end in _clip(work)]
+    blocks += [(start, end, "Sleep") for start, end in sleep]
+    unscheduled_exercise = 0
+    if exercise_minutes > 0:
+        for day_gaps in gaps:
+            slot = _take_slot(day_gaps, exercise_minutes)
+            if slot is None:
+                unscheduled_exercise += 1
+                continue
+            blocks.append((slot[0], slot[1], "Exercise"))
+
+    unscheduled = 0
+    open_days = list(range(len(DAYS)))
+    for _ in range(study_blocks):
+        slot = None
+        while open_days and slot is None:
+            day = open_days.pop(0)
+            slot = _take_slot(gaps[day], block_minutes)
+            if slot:
+                open_days.append(day)
+        if slot is None:
+            unscheduled += 1
+            continue
+        blocks.append((slot[0], slot[1], "Study"))
+
+    blocks.sort()
+    return {
+        "blocks": [
+            {
+                "day": DAYS[start // DAY_MINUTES],
+                "start": format_minutes(start),
+                "end": format_minutes(end),
+                "start_minute": start,
+                "end_minute": end,
+                "activity": activity,
+            }
+            for start, end, activity in blocks
+        ],
+        "unscheduled": unscheduled,
+        "unscheduled_exercise": unscheduled_exercise,
+    }
+
+
+def schedule_cohort(profiles):
+    """Batch version of schedule_week for a list of keyword-argument dicts.
+
+    Users on the same shift pattern and targets get identical plans, so each
+    distinct profile is only scheduled once. Every user still gets their own
+    copy of the plan.
+    """
+    plans = []
+    cache = {}
+    for profile in profiles:
+        key = tuple(sorted(
+            (name, tuple(tuple(s) if s else None for s in value) if name == "shifts" else value)
+            for name, value in profile.items()
+        ))
+        if key not in cache:
+            cache[key] = schedule_week(**profile)
+        plan = cache[key]
+        plans.append({
+            "blocks": [dict(block) for block in plan["blocks"]],
+            "unscheduled": plan["unscheduled"],
+            "unscheduled_exercise": plan["unscheduled_exercise"],
+        })
+    return plans
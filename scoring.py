@@ -0,0 +1,145 @@
+"""Scoring and badge logic shared by the Streamlit dashboard and the JSON API."""
+
+import numpy as np
+
+# Field name -> sidebar default, used to fill gaps in API requests
+DEFAULT_METRICS = {
+    "calories": 2000,
+    "hydration": 2.0,
+    "sleep_hours": 7.0,
+    "diet_quality": 75,
+    "daily_steps": 8000,
+    "exercise_minutes": 30,
+    "home_cooked": 15,
+    "takeout_meals": 6,
+    "study_blocks": 10,
+    "study_planned": 15,
+}
+
+# Field name -> largest accepted value, matching the sidebar max_value limits
+METRIC_LIMITS = {
+    "calories": 5000,
+    "hydration": 5.0,
+    "sleep_hours": 12.0,
+    "diet_quality": 100,
+    "daily_steps": 50000,
+    "exercise_minutes": 300,
+    "home_cooked": 21,
+    "takeout_meals": 21,
+    "study_blocks": 50,
+    "study_planned": 50,
+}
+
+# (minimum score, css class, icon, label), highest band first
+SCORE_BANDS = [
+    (80, "excellent", "⭐", "Excellent"),
+    (60, "good", "✓", "Good"),
+    (40, "fair", "⚠", "Fair"),
+    (0, "poor", "⚡", "Needs Attention"),
+]
+
+
+def get_score_band(score):
+    for minimum, css_class, icon, label in SCORE_BANDS:
+        if score >= minimum:
+            return css_class, icon, label
+    return SCORE_BANDS[-1][1:]
+
+
+# Helper function for score badges
+def get_score_badge(score):
+    css_class, icon, label = get_score_band(score)
+    return f'<span class="score-badge score-{css_class}">{icon} {score:.1f} - {label}</span>'
+
+
+def calculate_health_score(calories, hydration, sleep, diet_quality):
+    score = 0
+    # Diet quality (40%)
+    score += (diet_quality / 100) * 40
+    # Hydration (30%)
+    hydration_score = min(hydration / 2.5, 1.0) * 30
+    score += hydration_score
+    # Sleep (30%)
+    sleep_score = min(sleep / 8.0, 1.0) * 30
+    score += sleep_score
+    return min(score, 100)
+
+
+def calculate_fitness_score(steps, minutes):
+    score = 0
+    # Steps (50%)
+    steps_score = min(steps / 10000, 1.0) * 50
+    score += steps_score
+    # Exercise minutes (50%)
+    exercise_score = min(minutes / 60, 1.0) * 50
+    score += exercise_score
+    return min(score, 100)
+
+
+def calculate_finance_score(home_cooked, takeout):
+    total_meals = home_cooked + takeout
+    if total_meals == 0:
+        return 0
+    home_cooked_ratio = home_cooked / total_meals
+    return home_cooked_ratio * 100
+
+
+def calculate_growth_score(completed, planned):
+    if planned == 0:
+        return 0
+    completion_ratio = completed / planned
+    return min(completion_ratio * 100, 100)
+
+
+def score_batch(records):
+    """Score a list of metric dicts at once using the same weights as above.
+
+    Missing fields fall back to DEFAULT_METRICS. Returns one dict per record
+    with the four sub-scores, the overall score and its badge band.
+    """
+    if not records:
+        return []
+    columns = {
+        name: np.array([record.get(name, default) for record in records], dtype=float)
+        for name, default in DEFAULT_METRICS.items()
+    }
+
+    health = np.minimum(
+        columns["diet_quality"] / 100 * 40
+        + np.minimum(columns["hydration"] / 2.5, 1.0) * 30
+        + np.minimum(columns["sleep_hours"] / 8.0, 1.0) * 30,
+        100,
+    )
+    fitness = np.minimum(
+        np.minimum(columns["daily_steps"] / 10000, 1.0) * 50
+        + np.minimum(columns["exercise_minutes"] / 60, 1.0) * 50,
+        100,
+    )
+    total_meals = columns["home_cooked"] + columns["takeout_meals"]
+    finance = np.divide(
+        columns["home_cooked"], total_meals,
+        out=np.zeros_like(total_meals), where=total_meals != 0,
+    ) * 100
+    planned = columns["study_planned"]
+    growth = np.minimum(
+        np.divide(
+            columns["study_blocks"], planned,
+            out=np.zeros_like(planned), where=planned != 0,
+        ),
+        1.0,
+    ) * 100
+    overall = (health + fitness + finance + growth) / 4
+
+    results = []
+    for row in zip(overall.tolist(), health.tolist(), fitness.tolist(),
+                   finance.tolist(), growth.tolist()):
+        css_class, icon, label = get_score_band(row[0])
+        results.append({
+            "overall": row[0],
+            "health": row[1],
+            "fitness": row[2],
+            "finance": row[3],
+            "growth": row[4],
+            "badge": {"level": css_class, "icon": icon, "label": label},
+        })
+    return results
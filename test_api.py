@@ -0,0 +1,168 @@
+import asyncio
+import json
+
+import pytest
+
+import api
+from scoring import score_batch
+
+
+async def call(method, path, body=b""):
+    messages = []
+    sent_body = False
+
+    async def receive():
+        nonlocal sent_body
+        if sent_body:
+            return {"type": "http.disconnect"}
+        sent_body = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await api.app({"type": "http", "method": method, "path": path}, receive, send)
+    return messages[0]["status"], json.loads(messages[1]["body"])
+
+
+def request(method, path, body=b""):
+    return asyncio.run(call(method, path, body))
+
+
+@pytest.fixture(autouse=True)
+def fresh_coalescer(monkeypatch):
+    monkeypatch.setattr(api, "coalescer", api.ScoreCoalescer(window_ms=50))
+
+
+def test_health():
+    assert request("GET", "/health") == (200, {"status": "ok"})
+
+
+def test_score_uses_defaults_for_missing_fields():
+    status, body = request("POST", "/score", b'{"sleep_hours": 6}')
+    assert status == 200
+    assert body == score_batch([{"sleep_hours": 6}])[0]
+
+
+def test_batch():
+    status, body = request("POST", "/score/batch", b'{"items": [{}, {"hydration": 1}]}')
+    assert status == 200
+    assert body == {"results": score_batch([{}, {"hydration": 1}])}
+
+
+@pytest.mark.parametrize("body", [
+    b"{bad",
+    b"[]",
+    b'{"foo": 1}',
+    b'{"calories": "lots"}',
+    b'{"calories": true}',
+    b'{"calories": -1}',
+    b'{"home_cooked": NaN}',
+    b'{"home_cooked": Infinity}',
+    b'{"calories": 1e400}',
+    b'{"calories": 1' + b"0" * 400 + b"}",
+    b'{"home_cooked": 1e307, "takeout_meals": 1}',
+    b'{"daily_steps": 50001}',
+    b'{"exercise_minutes": 301}',
+    b'{"takeout_meals": 22}',
+])
+def test_score_rejects_bad_input(body):
+    status, payload = request("POST", "/score", body)
+    assert status == 400
+    assert "error" in payload
+
+
+def test_batch_rejects_bad_shape_and_items():
+    assert request("POST", "/score/batch", b"[{}]")[0] == 400
+    assert request("POST", "/score/batch", b'{"items": [{}, {"sleep_hours": -2}]}')[0] == 400
+
+
+def test_batch_too_large(monkeypatch):
+    monkeypatch.setattr(api, "MAX_BATCH_ITEMS", 2)
+    status, payload = request("POST", "/score/batch", b'{"items": [{}, {}, {}]}')
+    assert status == 413
+    assert "error" in payload
+
+
+def test_upper_limits_are_accepted():
+    status, body = request("POST", "/score", json.dumps(api.METRIC_LIMITS).encode())
+    assert status == 200
+    assert body["overall"] == score_batch([api.METRIC_LIMITS])[0]["overall"]
+
+
+def test_unexpected_errors_return_json_500(monkeypatch):
+    def broken_score_batch(records):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(api, "score_batch", broken_score_batch)
+    assert request("POST", "/score", b"{}") == (500, {"error": "internal server error"})
+    assert request("POST", "/score/batch", b'{"items": [{}]}') == (
+        500, {"error": "internal server error"})
+
+
+def test_unencodable_result_returns_json_500(monkeypatch):
+    def nan_score_batch(records):
+        return [{"overall": float("nan")} for _ in records]
+
+    monkeypatch.setattr(api, "score_batch", nan_score_batch)
+    # Same encoder as the stdlib fallback used when orjson is missing
+    monkeypatch.setattr(api, "dumps", lambda payload: json.dumps(payload, allow_nan=False).encode())
+    assert request("POST", "/score", b"{}") == (500, {"error": "internal server error"})
+
+
+def test_unknown_path_and_method():
+    assert request("GET", "/nope")[0] == 404
+    assert request("GET", "/score")[0] == 405
+    assert request("DELETE", "/score/batch")[0] == 405
+
+
+def test_validate_metrics_converts_to_finite_floats():
+    assert api.validate_metrics({"calories": 2000}) == {"calories": 2000.0}
+    for value in (float("inf"), float("nan"), 10 ** 400, 1e307):
+        with pytest.raises(api.RequestError):
+            api.validate_metrics({"calories": value})
+
+
+def test_concurrent_requests_share_a_batch(monkeypatch):
+    batch_sizes = []
+
+    def counting_score_batch(records):
+        batch_sizes.append(len(records))
+        return score_batch(records)
+
+    monkeypatch.setattr(api, "score_batch", counting_score_batch)
+
+    async def main():
+        return await asyncio.gather(*(
+            call("POST", "/score", json.dumps({"sleep_hours": hours}).encode())
+            for hours in range(8)
+        ))
+
+    responses = asyncio.run(main())
+    assert [status for status, _ in responses] == [200] * 8
+    assert batch_sizes == [8]
+
+
+def test_lone_request_skips_the_window():
+    coalescer = api.ScoreCoalescer(window_ms=10_000)
+
+    async def main():
+        with coalescer.request():
+            return await asyncio.wait_for(coalescer.score({}), timeout=1)
+
+    assert asyncio.run(main()) == score_batch([{}])[0]
+
+
+def test_bad_record_only_fails_its_own_request():
+    coalescer = api.ScoreCoalescer(window_ms=10)
+
+    async def main():
+        return await asyncio.gather(
+            coalescer.score({}),
+            coalescer.score({"calories": "not a number"}),
+            return_exceptions=True,
+        )
+
+    good, bad = asyncio.run(main())
+    assert good == score_batch([{}])[0]
+    assert isinstance(bad, ValueError)
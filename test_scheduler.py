@@ -0,0 +1,174 @@
+from scheduler import (
+    DAY_MINUTES,
+    free_intervals,
+    merge_intervals,
+    parse_work_hours,
+    schedule_cohort,
+    schedule_week,
+    split_at_midnight,
+    subtract_intervals,
+)
+
+NINE_TO_FIVE = (9 * 60, 17 * 60)
+NIGHT_SHIFT = (22 * 60, 6 * 60)
+EARLY_SHIFT = (5 * 60, 13 * 60)
+LATE_SHIFT = (16 * 60, 24 * 60)
+
+
+def blocks_of(plan, activity):
+    return [
+        (block["start_minute"], block["end_minute"])
+        for block in plan["blocks"]
+        if block["activity"] == activity
+    ]
+
+
+def overlaps(a, b):
+    return any(start < other_end and other_start < end
+               for start, end in a for other_start, other_end in b)
+
+
+def total(intervals):
+    return sum(end - start for start, end in intervals)
+
+
+class TestParseWorkHours:
+    def test_parses_day_and_overnight_shifts(self):
+        assert parse_work_hours("09:00 - 17:00") == NINE_TO_FIVE
+        assert parse_work_hours("Work Hours: 22:00-06:00") == NIGHT_SHIFT
+
+    def test_rejects_invalid_minutes(self):
+        assert parse_work_hours("09:75 - 17:00") is None
+        assert parse_work_hours("09:00 - 17:60") is None
+
+    def test_rejects_equal_start_and_end(self):
+        assert parse_work_hours("09:00 - 09:00") is None
+
+    def test_rejects_short_forms_and_garbage(self):
+        assert parse_work_hours("9 - 5") is None
+        assert parse_work_hours("") is None
+        assert parse_work_hours(None) is None
+
+
+class TestIntervals:
+    def test_merge_folds_overlapping_and_touching(self):
+        assert merge_intervals([(5, 8), (1, 3), (2, 4), (8, 9)]) == [[1, 4], [5, 9]]
+
+    def test_merge_keeps_contained_interval_inside(self):
+        assert merge_intervals([(0, 10), (2, 3)]) == [[0, 10]]
+
+    def test_merge_empty(self):
+        assert merge_intervals([]) == []
+
+    def test_free_intervals_fill_gaps(self):
+        assert free_intervals([(2, 4), (6, 8)], 0, 10) == [[0, 2], [4, 6], [8, 10]]
+
+    def test_free_intervals_respect_window(self):
+        assert free_intervals([(0, 5), (8, 12)], 0, 10) == [[5, 8]]
+        assert free_intervals([], 0, 10) == [[0, 10]]
+        assert free_intervals([(0, 10)], 0, 10) == []
+
+    def test_subtract_intervals(self):
+        assert subtract_intervals([(0, 10)], [(2, 3), (5, 12)]) == [[0, 2], [3, 5]]
+        assert subtract_intervals([(0, 4)], [(4, 6)]) == [[0, 4]]
+
+    def test_split_at_midnight(self):
+        assert list(split_at_midnight(22 * 60, DAY_MINUTES + 6 * 60)) == [
+            (0, 22 * 60, DAY_MINUTES),
+            (1, DAY_MINUTES, DAY_MINUTES + 6 * 60),
+        ]
+
+
+class TestScheduleWeek:
+    def test_day_shift_week(self):
+        plan = schedule_week([NINE_TO_FIVE] * 5, 15, commute_minutes=30)
+        assert plan["unscheduled"] == 0
+        study = blocks_of(plan, "Study")
+        assert len(study) == 15
+        assert not overlaps(study, blocks_of(plan, "Work"))
+        assert not overlaps(study, blocks_of(plan, "Sleep"))
+        assert len(blocks_of(plan, "Exercise")) == 7
+
+    def test_study_is_spread_round_robin(self):
+        plan = schedule_week([None] * 7, 7, exercise_minutes=0)
+        days = [block["day"] for block in plan["blocks"] if block["activity"] == "Study"]
+        assert sorted(days) == sorted(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"])
+
+    def test_no_shift_week_sleeps_until_wake_time(self):
+        plan = schedule_week([], 0, sleep_hours=8, wake_time=7 * 60)
+        sleep = blocks_of(plan, "Sleep")
+        assert (0, 7 * 60) in sleep
+        assert (23 * 60, DAY_MINUTES + 7 * 60) in sleep
+        assert blocks_of(plan, "Work") == []
+
+    def test_night_shift_sleeps_after_commute_home(self):
+        plan = schedule_week([NIGHT_SHIFT] * 5, 15, commute_minutes=30)
+        sleep = blocks_of(plan, "Sleep")
+        # Monday night shift ends Tuesday 06:00, home by 06:30
+        tuesday_sleep = (DAY_MINUTES + 6 * 60 + 30, DAY_MINUTES + 14 * 60 + 30)
+        assert tuesday_sleep in sleep
+        assert not overlaps(sleep, blocks_of(plan, "Work"))
+        assert not overlaps(blocks_of(plan, "Study"), sleep)
+        assert plan["unscheduled"] == 0
+
+    def test_night_shift_never_leaves_a_day_without_sleep(self):
+        plan = schedule_week([NIGHT_SHIFT] * 5, 15, commute_minutes=30)
+        sleep = blocks_of(plan, "Sleep")
+        for day in range(1, 6):
+            start, end = day * DAY_MINUTES, (day + 1) * DAY_MINUTES
+            slept = total(subtract_intervals(sleep, [(0, start), (end, 10 * DAY_MINUTES)]))
+            assert slept >= 8 * 60
+
+    def test_early_shift_gets_full_sleep_before_commute(self):
+        plan = schedule_week([EARLY_SHIFT] * 5, 0, sleep_hours=8, commute_minutes=30)
+        sleep = blocks_of(plan, "Sleep")
+        # Tuesday's 05:00 start means asleep 20:30 Monday to 04:30 Tuesday
+        assert (20 * 60 + 30, DAY_MINUTES + 4 * 60 + 30) in sleep
+        assert not overlaps(sleep, blocks_of(plan, "Work"))
+
+    def test_late_shift_sleeps_once_home(self):
+        plan = schedule_week([LATE_SHIFT] * 5, 15, sleep_hours=8, commute_minutes=30)
+        sleep = blocks_of(plan, "Sleep")
+        # Home at 00:30 after each shift, so sleep runs 00:30-08:30
+        for day in range(1, 6):
+            start, end = day * DAY_MINUTES, (day + 1) * DAY_MINUTES
+            slept = total(subtract_intervals(sleep, [(0, start), (end, 10 * DAY_MINUTES)]))
+            assert slept >= 8 * 60
+            assert (start + 30, start + 8 * 60 + 30) in sleep
+        assert not overlaps(sleep, blocks_of(plan, "Work"))
+
+    def test_last_sunday_night_shift_spills_into_monday(self):
+        plan = schedule_week([None] * 6 + [NIGHT_SHIFT], 0, commute_minutes=0)
+        assert (0, 6 * 60) in blocks_of(plan, "Work")
+        assert not overlaps(blocks_of(plan, "Sleep"), blocks_of(plan, "Work"))
+
+    def test_oversubscribed_week_counts_unscheduled(self):
+        plan = schedule_week([NINE_TO_FIVE] * 7, 50, block_minutes=120,
+                             commute_minutes=60, exercise_minutes=60)
+        placed = len(blocks_of(plan, "Study"))
+        assert placed < 50
+        assert placed + plan["unscheduled"] == 50
+
+    def test_exercise_that_does_not_fit_is_counted(self):
+        plan = schedule_week([NINE_TO_FIVE] * 5, 0, sleep_hours=9,
+                             exercise_minutes=300, commute_minutes=30)
+        assert plan["unscheduled_exercise"] == 5
+        assert len(blocks_of(plan, "Exercise")) == 2
+
+    def test_exercise_fits_every_day(self):
+        plan = schedule_week([NINE_TO_FIVE] * 5, 0, commute_minutes=30)
+        assert plan["unscheduled_exercise"] == 0
+
+
+class TestScheduleCohort:
+    def test_matches_schedule_week(self):
+        profile = {"shifts": [NINE_TO_FIVE] * 5, "study_blocks": 10}
+        assert schedule_cohort([profile]) == [schedule_week(**profile)]
+
+    def test_plans_are_independent_copies(self):
+        profile = {"shifts": [NINE_TO_FIVE] * 5, "study_blocks": 10}
+        first, second = schedule_cohort([profile, dict(profile)])
+        assert first == second
+        first["blocks"][0]["activity"] = "Nap"
+        first["blocks"].clear()
+        assert second["blocks"][0]["activity"] != "Nap"
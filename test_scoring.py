@@ -0,0 +1,72 @@
+import pytest
+
+from scoring import (
+    DEFAULT_METRICS,
+    calculate_finance_score,
+    calculate_fitness_score,
+    calculate_growth_score,
+    calculate_health_score,
+    get_score_badge,
+    get_score_band,
+    score_batch,
+)
+
+RECORDS = [
+    {},
+    dict(DEFAULT_METRICS),
+    {"calories": 2500, "hydration": 3.5, "sleep_hours": 9, "diet_quality": 100,
+     "daily_steps": 15000, "exercise_minutes": 90, "home_cooked": 21,
+     "takeout_meals": 0, "study_blocks": 20, "study_planned": 15},
+    {"hydration": 0.5, "sleep_hours": 4, "diet_quality": 10, "daily_steps": 0,
+     "exercise_minutes": 0, "home_cooked": 0, "takeout_meals": 0,
+     "study_blocks": 0, "study_planned": 0},
+    {"study_blocks": 3, "study_planned": 0, "home_cooked": 0, "takeout_meals": 7},
+]
+
+
+def expected_scores(record):
+    metrics = {**DEFAULT_METRICS, **record}
+    health = calculate_health_score(metrics["calories"], metrics["hydration"],
+                                    metrics["sleep_hours"], metrics["diet_quality"])
+    fitness = calculate_fitness_score(metrics["daily_steps"], metrics["exercise_minutes"])
+    finance = calculate_finance_score(metrics["home_cooked"], metrics["takeout_meals"])
+    growth = calculate_growth_score(metrics["study_blocks"], metrics["study_planned"])
+    return health, fitness, finance, growth, (health + fitness + finance + growth) / 4
+
+
+@pytest.mark.parametrize("record", RECORDS)
+def test_score_batch_matches_single_scores(record):
+    health, fitness, finance, growth, overall = expected_scores(record)
+    [result] = score_batch([record])
+    assert result["health"] == pytest.approx(health)
+    assert result["fitness"] == pytest.approx(fitness)
+    assert result["finance"] == pytest.approx(finance)
+    assert result["growth"] == pytest.approx(growth)
+    assert result["overall"] == pytest.approx(overall)
+    level, icon, label = get_score_band(overall)
+    assert result["badge"] == {"level": level, "icon": icon, "label": label}
+
+
+def test_score_batch_scores_records_independently():
+    results = score_batch(RECORDS)
+    assert results == [score_batch([record])[0] for record in RECORDS]
+
+
+def test_score_batch_huge_values_stay_finite():
+    [result] = score_batch([{"home_cooked": 1e307, "takeout_meals": 1,
+                             "study_blocks": 1e307, "study_planned": 1}])
+    assert result["finance"] == pytest.approx(100)
+    assert result["growth"] == 100
+
+
+def test_score_batch_empty():
+    assert score_batch([]) == []
+
+
+@pytest.mark.parametrize("score, level", [
+    (100, "excellent"), (80, "excellent"), (79.9, "good"), (60, "good"),
+    (59.9, "fair"), (40, "fair"), (39.9, "poor"), (0, "poor"),
+])
+def test_score_bands(score, level):
+    assert get_score_band(score)[0] == level
+    assert f"score-{level}" in get_score_badge(score)